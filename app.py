@@ -13,16 +13,17 @@ def convert_regex_to_nfa_endpoint():
         return jsonify({"error": "Invalid request: 'regex' key is missing."}), 400
 
     regex_string = data['regex']
+    engine = data.get('engine', 'thompson')
 
     try:
         # One simple, clean call to our robust, multi-stage logic package.
-        nfa_object = regex_to_nfa(regex_string)
+        nfa_object = regex_to_nfa(regex_string, engine)
         # The .to_dict() method is part of the NFA class, which is correctly returned.
         return jsonify(nfa_object.to_dict()), 200
 
     except ValueError as e:
-        # This now cleanly catches both empty strings and any RegexSyntaxError
-        # that our logic package has converted to a ValueError.
+        # This now cleanly catches empty strings, unknown engines and any
+        # RegexSyntaxError that our logic package has converted to a ValueError.
         return jsonify({"error": str(e)}), 400
     except Exception:
         # For any other unexpected crash, log it for the developer
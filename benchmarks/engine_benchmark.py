@@ -0,0 +1,109 @@
+# benchmarks/engine_benchmark.py
+"""
+Compares the NFA construction engines on build time and output size.
+
+Each regex is tokenized and parsed once; only the builder is timed. Results
+are grouped by corpus category and written to a JSON file so runs can be
+compared across commits. A category that fails to parse or build (e.g. an
+adversarial case deeper than the recursion limit) is recorded with its error
+instead of aborting the run.
+
+Usage:
+    python -m benchmarks.engine_benchmark
+    python -m benchmarks.engine_benchmark --repeat 20 --deep 16,64,128 --wide 64,256,512
+"""
+
+import argparse
+import json
+import platform
+import time
+
+from logic import ENGINES
+from logic.parser import RegexParser
+from logic.tokenizer import tokenize
+from .load_test import (build_corpus, deep_regex, wide_regex, git_commit,
+                        positive_int, positive_int_list)
+
+
+def _error(exception: Exception) -> dict:
+    return {"error": type(exception).__name__, "message": str(exception)}
+
+
+def measure(engine: str, asts: list, repeat: int) -> dict:
+    """
+    Builds every AST `repeat` times with one engine and sums time and output size.
+    If any build fails, the error is returned in place of the measurements.
+    """
+    builder_class = ENGINES[engine]
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            nfas = [builder_class().build(ast) for ast in asts]
+        except Exception as e:
+            return _error(e)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    transitions = sum(len(nfa.transitions) for nfa in nfas)
+    return {
+        "build_ms": round(best * 1000, 3),
+        "states": sum(len(nfa.states) for nfa in nfas),
+        "transitions": transitions,
+        "epsilon_transitions": sum(1 for nfa in nfas for t in nfa.transitions if t[1] == ""),
+        "json_bytes": sum(len(json.dumps(nfa.to_dict())) for nfa in nfas),
+    }
+
+
+def main(argv: list[str] | None = None) -> dict:
+    parser = argparse.ArgumentParser(description="Build time and output size of the NFA engines.")
+    parser.add_argument("--corpus-size", type=positive_int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--deep", type=positive_int_list, default="16,64",
+                        help="Nesting depths of the deep cases.")
+    parser.add_argument("--wide", type=positive_int_list, default="64,512",
+                        help="Alternative counts of the wide cases.")
+    parser.add_argument("--repeat", type=positive_int, default=5, help="Runs per measurement; the best is kept.")
+    parser.add_argument("--output", default="engine_benchmark_results.json")
+    args = parser.parse_args(argv)
+
+    categories = {
+        "realistic": [regex for _, regex in build_corpus(args.corpus_size, args.seed,
+                                                          deep_depths=(), wide_widths=())],
+        **{f"deep_{d}": [deep_regex(d)] for d in args.deep},
+        **{f"wide_{w}": [wide_regex(w)] for w in args.wide},
+    }
+
+    results = {}
+    for name, corpus in categories.items():
+        try:
+            asts = [RegexParser(tokenize(regex)).parse() for regex in corpus]
+        except Exception as e:
+            results[name] = {engine: _error(e) for engine in ENGINES}
+            continue
+        results[name] = {engine: measure(engine, asts, args.repeat) for engine in ENGINES}
+
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "repeat": args.repeat,
+        "categories": results,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for name, by_engine in results.items():
+        for engine, stats in by_engine.items():
+            if "error" in stats:
+                print(f"{name:<10} {engine:<9} failed: {stats['error']}")
+                continue
+            print(f"{name:<10} {engine:<9} {stats['build_ms']:>10}ms  states={stats['states']:<7} "
+                  f"transitions={stats['transitions']:<7} epsilon={stats['epsilon_transitions']}")
+    print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+# benchmarks/load_test.py
+"""
+A fully local load generator for the /api/regex-to-nfa endpoint.
+
+It replays a regex corpus against a server at one or more concurrency levels
+and writes throughput, latency percentiles, error rates and per-worker RSS
+growth to a JSON file so runs can be compared across commits.
+
+Usage:
+    python -m benchmarks.load_test --target inprocess
+    python -m benchmarks.load_test --target gunicorn --workers 4 --concurrency 1,4,16,64
+    python -m benchmarks.load_test --url http://127.0.0.1:5000 --corpus my_regexes.txt
+"""
+
+import argparse
+import http.client
+import json
+import math
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+
+from logic import ENGINES
+
+ENDPOINT = "/api/regex-to-nfa"
+ALPHABET = "abcdefghijklmnopqrstuvwxyz0123456789"
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# --- Corpus Generation ---
+
+def _random_regex(rng: random.Random, length: int) -> str:
+    """
+    Builds a syntactically valid regex of roughly `length` characters
+    by growing it out of operands, groups, unions and stars.
+    """
+    parts = []
+    size = 0
+    while size < length:
+        roll = rng.random()
+        if roll < 0.55 or length - size < 4:
+            piece = rng.choice(ALPHABET)
+        elif roll < 0.75:
+            inner = _random_regex(rng, rng.randint(1, max(1, (length - size) // 2)))
+            piece = f"({inner})"
+        elif roll < 0.9 and parts:
+            piece = "|" + rng.choice(ALPHABET)
+        else:
+            piece = rng.choice(ALPHABET) + "*"
+        parts.append(piece)
+        size += len(piece)
+    return "".join(parts)
+
+
+def deep_regex(depth: int) -> str:
+    """An adversarial case: `depth` levels of nested, starred groups, e.g. ((a)*b)*b."""
+    regex = "a"
+    for _ in range(depth):
+        regex = f"({regex})*b"
+    return regex
+
+
+def wide_regex(width: int) -> str:
+    """An adversarial case: a flat union of `width` alternatives, e.g. a|b|c|..."""
+    return "|".join(ALPHABET[i % len(ALPHABET)] for i in range(width))
+
+
+def build_corpus(size: int = 500, seed: int = 0, deep_depths=(16, 64), wide_widths=(64, 512),
+                 adversarial_ratio: float = 0.05) -> list[tuple[str, str]]:
+    """
+    Generates a deterministic corpus of (category, regex) pairs for a given seed.
+    Most entries are 'realistic': a long-tailed (log-normal) length distribution similar
+    to hand-written patterns. A fixed share is drawn from the adversarial cases, which
+    are categorized as 'deep_<depth>' and 'wide_<width>'.
+    """
+    rng = random.Random(seed)
+    adversarial = ([(f"deep_{d}", deep_regex(d)) for d in deep_depths]
+                   + [(f"wide_{w}", wide_regex(w)) for w in wide_widths])
+
+    corpus = []
+    for _ in range(size):
+        if adversarial and rng.random() < adversarial_ratio:
+            corpus.append(rng.choice(adversarial))
+        else:
+            length = min(200, max(1, int(rng.lognormvariate(2.3, 0.7))))
+            corpus.append(("realistic", _random_regex(rng, length)))
+    return corpus
+
+
+def load_corpus(path: str) -> list[tuple[str, str]]:
+    """Reads a corpus file with one regex per line. Blank lines are ignored; every entry is 'file'."""
+    with open(path, encoding="utf-8") as f:
+        return [("file", line.rstrip("\n")) for line in f if line.strip()]
+
+
+# --- Process Memory (Linux /proc) ---
+
+def read_rss_kb(pid: int) -> int | None:
+    """Returns the resident set size of a process in KiB, or None if it cannot be read."""
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def child_pids(pid: int) -> list[int]:
+    """Returns the direct children of a process (the gunicorn workers of a master)."""
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            return sorted(int(p) for p in f.read().split())
+    except (OSError, ValueError):
+        return []
+
+
+# --- Server Targets ---
+
+class InProcessServer:
+    """
+    Serves the Flask app from a background thread of the current process.
+    Its only "worker" is the load generator itself, so the RSS it reports also
+    includes the client threads and collected results.
+    """
+    rss_includes_client = True
+
+    def __init__(self):
+        from werkzeug.serving import WSGIRequestHandler, make_server
+        from app import app as flask_app
+
+        class QuietHandler(WSGIRequestHandler):
+            # Per-request access logging would dominate the measured latency.
+            def log_request(self, *args, **kwargs):
+                pass
+
+        self._server = make_server("127.0.0.1", 0, flask_app, threaded=True, request_handler=QuietHandler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._thread.join()
+
+    def worker_pids(self) -> list[int]:
+        return [os.getpid()]
+
+
+class GunicornServer:
+    """Spawns gunicorn the same way the Dockerfile does, bound to a free local port."""
+    rss_includes_client = False
+
+    def __init__(self, workers: int = 4, startup_timeout: float = 15.0):
+        self.workers = workers
+        self.startup_timeout = startup_timeout
+        self.port = _free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        self._process = None
+
+    def __enter__(self):
+        self._process = subprocess.Popen(
+            [sys.executable, "-m", "gunicorn", "--bind", f"127.0.0.1:{self.port}",
+             f"--workers={self.workers}", "app:app"],
+            cwd=REPO_ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + self.startup_timeout
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError("gunicorn exited during startup. Is it installed?")
+            if _is_up(self.url):
+                self._wait_for_workers(min(deadline, time.monotonic() + 2.0))
+                return self
+            time.sleep(0.1)
+        self.__exit__()
+        raise RuntimeError(f"gunicorn did not become ready within {self.startup_timeout}s.")
+
+    def _wait_for_workers(self, deadline: float):
+        """
+        Gives the remaining workers a moment to fork so every one is sampled for RSS.
+        Worker pids are only visible through /proc, so elsewhere this returns at once.
+        """
+        if not os.path.exists(f"/proc/{self._process.pid}/task/{self._process.pid}/children"):
+            return
+        while len(self.worker_pids()) < self.workers and time.monotonic() < deadline:
+            time.sleep(0.05)
+
+    def __exit__(self, *exc_info):
+        self._process.terminate()
+        try:
+            self._process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+
+    def worker_pids(self) -> list[int]:
+        return child_pids(self._process.pid)
+
+
+class ExternalServer:
+    """An already running local server. Worker memory is only sampled if a master pid is given."""
+    rss_includes_client = False
+
+    def __init__(self, url: str, pid: int | None = None):
+        self.url = url.rstrip("/")
+        self.pid = pid
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def worker_pids(self) -> list[int]:
+        if self.pid is None:
+            return []
+        return child_pids(self.pid) or [self.pid]
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _is_up(url: str) -> bool:
+    status, _ = send_request(url, "a", timeout=1.0)
+    return status == 200
+
+
+# --- Load Generation ---
+
+def send_request(url: str, regex: str, timeout: float = 30.0,
+                 engine: str | None = None) -> tuple[int | None, float]:
+    """
+    POSTs one regex and returns (status_code, latency_seconds).
+    The status is None when the request failed at the transport level, including
+    a response cut short by a dying worker (IncompleteRead, BadStatusLine, ...).
+    """
+    payload = {"regex": regex}
+    if engine is not None:
+        payload["engine"] = engine
+    body = json.dumps(payload).encode("utf-8")
+    req = urllib.request.Request(url + ENDPOINT, data=body, method="POST",
+                                 headers={"Content-Type": "application/json"})
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    except (urllib.error.URLError, http.client.HTTPException, OSError):
+        status = None
+    return status, time.perf_counter() - start
+
+
+def percentile(sorted_values: list[float], pct: float) -> float | None:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def _ms(value: float | None) -> float | None:
+    return None if value is None else round(value * 1000, 3)
+
+
+def summarize(outcomes: list[tuple[int | None, float]]) -> dict:
+    """Latency percentiles, status counts and error rate of a list of (status, latency) outcomes."""
+    latencies = sorted(latency for _, latency in outcomes)
+    status_counts = {}
+    for status, _ in outcomes:
+        key = str(status) if status is not None else "connection_error"
+        status_counts[key] = status_counts.get(key, 0) + 1
+    errors = sum(count for key, count in status_counts.items() if key != "200")
+
+    return {
+        "requests": len(outcomes),
+        "latency_ms": {
+            "mean": _ms(sum(latencies) / len(latencies)) if latencies else None,
+            "p50": _ms(percentile(latencies, 50)),
+            "p95": _ms(percentile(latencies, 95)),
+            "p99": _ms(percentile(latencies, 99)),
+            "max": _ms(latencies[-1]) if latencies else None,
+        },
+        "error_rate": round(errors / len(outcomes), 4) if outcomes else None,
+        "status_counts": status_counts,
+    }
+
+
+def run_level(url: str, corpus: list[tuple[str, str]], concurrency: int, total_requests: int,
+              timeout: float = 30.0, engine: str | None = None) -> dict:
+    """
+    Replays `total_requests` corpus entries (cycling) with `concurrency` client threads.
+    Results are reported for the level as a whole and per corpus category, so a known
+    failing adversarial shape cannot hide a regression in the others.
+    """
+    results = []
+    lock = threading.Lock()
+    cursor = iter(range(total_requests))
+
+    def client():
+        while True:
+            with lock:
+                i = next(cursor, None)
+            if i is None:
+                return
+            category, regex = corpus[i % len(corpus)]
+            status, latency = send_request(url, regex, timeout, engine)
+            with lock:
+                results.append((category, status, latency))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        clients = [pool.submit(client) for _ in range(concurrency)]
+    elapsed = time.perf_counter() - start
+    # Re-raise anything a client thread died of, rather than silently losing its requests.
+    for future in clients:
+        future.result()
+
+    by_category = {}
+    for category, status, latency in results:
+        by_category.setdefault(category, []).append((status, latency))
+
+    level = {
+        "concurrency": concurrency,
+        "duration_s": round(elapsed, 3),
+        "throughput_rps": round(len(results) / elapsed, 2) if elapsed else None,
+    }
+    level.update(summarize([(status, latency) for _, status, latency in results]))
+    level["categories"] = {name: summarize(outcomes) for name, outcomes in sorted(by_category.items())}
+    return level
+
+
+def run_load_test(server, corpus: list[tuple[str, str]], concurrency_levels: list[int],
+                  requests_per_level: int, warmup_requests: int = 20, timeout: float = 30.0,
+                  engine: str | None = None) -> list[dict]:
+    """
+    Runs each concurrency level in turn against an entered server target,
+    sampling the RSS of every worker before and after the level.
+    """
+    for i in range(warmup_requests):
+        send_request(server.url, corpus[i % len(corpus)][1], timeout, engine)
+
+    levels = []
+    for concurrency in concurrency_levels:
+        rss_before = {pid: read_rss_kb(pid) for pid in server.worker_pids()}
+        level = run_level(server.url, corpus, concurrency, requests_per_level, timeout, engine)
+        rss_after = {pid: read_rss_kb(pid) for pid in server.worker_pids()}
+
+        level["worker_rss_kb"] = [
+            {
+                "pid": pid,
+                "before": rss_before.get(pid),
+                "after": rss_after.get(pid),
+                "growth": (rss_after[pid] - rss_before[pid])
+                if rss_after.get(pid) is not None and rss_before.get(pid) is not None else None,
+            }
+            for pid in sorted(set(rss_before) | set(rss_after))
+        ]
+        levels.append(level)
+    return levels
+
+
+def git_commit() -> str | None:
+    """The HEAD commit of the repository, used to tag reports. None outside a git checkout."""
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], cwd=REPO_ROOT, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+# --- Command Line ---
+
+def positive_int(value: str) -> int:
+    """argparse type for counts that must be at least 1."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not an integer.")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{number} must be a positive integer.")
+    return number
+
+
+def non_negative_int(value: str) -> int:
+    """argparse type for counts that may be 0."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not an integer.")
+    if number < 0:
+        raise argparse.ArgumentTypeError(f"{number} must not be negative.")
+    return number
+
+
+def positive_int_list(value: str) -> list[int]:
+    """argparse type for a non-empty, comma-separated list of positive integers."""
+    numbers = [positive_int(v.strip()) for v in value.split(",") if v.strip()]
+    if not numbers:
+        raise argparse.ArgumentTypeError("expected at least one value.")
+    return numbers
+
+
+def positive_float(value: str) -> float:
+    """argparse type for durations that must be greater than 0."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a number.")
+    if not math.isfinite(number) or number <= 0:
+        raise argparse.ArgumentTypeError(f"{value} must be a positive number.")
+    return number
+
+
+def fraction(value: str) -> float:
+    """argparse type for ratios between 0 and 1 inclusive."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"'{value}' is not a number.")
+    if not 0 <= number <= 1:
+        raise argparse.ArgumentTypeError(f"{value} must be between 0 and 1.")
+    return number
+
+
+def _format(value, spec: str = "") -> str:
+    return "n/a" if value is None else format(value, spec)
+
+
+def main(argv: list[str] | None = None) -> dict:
+    parser = argparse.ArgumentParser(description="Local load test for the regex-to-NFA API.")
+    parser.add_argument("--target", choices=["inprocess", "gunicorn"], default="inprocess",
+                        help="Which local server to start (ignored when --url is given).")
+    parser.add_argument("--url", help="Base URL of an already running local server.")
+    parser.add_argument("--pid", type=int, help="Master pid of the --url server, for worker RSS sampling.")
+    parser.add_argument("--workers", type=positive_int, default=4, help="gunicorn worker count (Dockerfile uses 4).")
+    parser.add_argument("--concurrency", type=positive_int_list, default="1,4,16", help="Comma-separated client concurrency levels.")
+    parser.add_argument("--requests", type=positive_int, default=500, help="Requests sent per concurrency level.")
+    parser.add_argument("--warmup", type=non_negative_int, default=20, help="Unmeasured requests sent before the first level.")
+    parser.add_argument("--timeout", type=positive_float, default=30.0, help="Per-request timeout in seconds.")
+    parser.add_argument("--engine", choices=list(ENGINES),
+                        help="NFA construction engine to request (server default when omitted).")
+    parser.add_argument("--corpus", help="File with one regex per line. Generated when omitted.")
+    parser.add_argument("--corpus-size", type=positive_int, default=500)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--deep", type=positive_int_list, default="16,64", help="Nesting depths of the adversarial deep cases.")
+    parser.add_argument("--wide", type=positive_int_list, default="64,512", help="Alternative counts of the adversarial wide cases.")
+    parser.add_argument("--adversarial-ratio", type=fraction, default=0.05,
+                        help="Share of the generated corpus drawn from the adversarial cases (0 to 1).")
+    parser.add_argument("--output", default="load_test_results.json", help="Where to write the JSON report.")
+    args = parser.parse_args(argv)
+
+    if args.corpus:
+        corpus = load_corpus(args.corpus)
+    else:
+        corpus = build_corpus(args.corpus_size, args.seed, args.deep, args.wide, args.adversarial_ratio)
+    if not corpus:
+        parser.error("The corpus is empty.")
+
+    if args.url:
+        server, target = ExternalServer(args.url, args.pid), "external"
+    elif args.target == "gunicorn":
+        server, target = GunicornServer(args.workers), "gunicorn"
+    else:
+        server, target = InProcessServer(), "inprocess"
+
+    with server:
+        levels = run_load_test(server, corpus, args.concurrency, args.requests,
+                               args.warmup, args.timeout, args.engine)
+
+    lengths = sorted(len(regex) for _, regex in corpus)
+    category_sizes = {}
+    for category, _ in corpus:
+        category_sizes[category] = category_sizes.get(category, 0) + 1
+    report = {
+        "commit": git_commit(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "target": target,
+        "workers": args.workers if target == "gunicorn" else None,
+        "engine": args.engine,
+        # In-process RSS is the load generator's own process; do not compare it with gunicorn workers.
+        "rss_includes_client": server.rss_includes_client,
+        "corpus": {
+            "source": args.corpus or "generated",
+            "size": len(corpus),
+            "seed": None if args.corpus else args.seed,
+            "length_p50": lengths[len(lengths) // 2],
+            "length_max": lengths[-1],
+            "categories": dict(sorted(category_sizes.items())),
+        },
+        "levels": levels,
+    }
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    for level in levels:
+        latency = level["latency_ms"]
+        print(f"c={level['concurrency']:<4} {_format(level['throughput_rps'], '>9')} req/s  "
+              f"p50={_format(latency['p50'])}ms p95={_format(latency['p95'])}ms "
+              f"p99={_format(latency['p99'])}ms  errors={_format(level['error_rate'], '.2%')}")
+        for name, category in level["categories"].items():
+            if category["error_rate"]:
+                print(f"       {name}: errors={category['error_rate']:.2%} {category['status_counts']}")
+    print(f"Report written to {args.output}")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -4,18 +4,29 @@
 from .tokenizer import tokenize, RegexSyntaxError
 from .parser import RegexParser
 from .nfa_builder import NFABuilder, NFA
+from .glushkov_builder import GlushkovBuilder
 
+# The available construction engines, selectable per request.
+ENGINES = {
+    "thompson": NFABuilder,
+    "glushkov": GlushkovBuilder,
+}
 
-def regex_to_nfa(regex_string: str) -> NFA:
+
+def regex_to_nfa(regex_string: str, engine: str = "thompson") -> NFA:
     """
     The main public entry point for the logic package.
     Orchestrates the three-stage conversion process:
     1. Tokenize the raw string.
     2. Parse the tokens into an Abstract Syntax Tree (AST).
-    3. Build the NFA by walking the AST.
+    3. Build the NFA by walking the AST with the chosen engine:
+       'thompson' (Thompson's construction, with epsilon transitions) or
+       'glushkov' (position automaton, n+1 states and no epsilon transitions).
     """
     if not regex_string:
         raise ValueError("Regex string cannot be empty.")
+    if not isinstance(engine, str) or engine not in ENGINES:
+        raise ValueError(f"Unknown engine '{engine}'. Expected one of: {', '.join(ENGINES)}.")
 
     try:
         # Stage 1: Tokenize the raw string into a stream of Tokens.
@@ -26,7 +37,7 @@ def regex_to_nfa(regex_string: str) -> NFA:
         ast = parser.parse()
 
         # Stage 3: Build the final NFA by walking the AST.
-        builder = NFABuilder()
+        builder = ENGINES[engine]()
         nfa = builder.build(ast)
 
         return nfa
@@ -0,0 +1,148 @@
+# logic/glushkov_builder.py
+
+# Imports from our own package to know the AST structure
+from .ast_nodes import ASTNode, OperandNode, StarNode, ConcatNode, UnionNode
+from .nfa_builder import NFA
+
+
+# --- Position Sets ---
+# Sets of positions are stored as bitsets in plain Python ints: bit i is set
+# when position i is in the set. Follow sets are never copied per position
+# while walking the AST: each Concat/Star node records one (last, first) pair
+# that references its children's bitsets, meaning "every position in `last`
+# can be followed by every position in `first`". The pairs are only resolved
+# into per-position follow sets when the NFA is emitted.
+
+_WORD_BYTES = 8
+_ZERO_WORD = bytes(_WORD_BYTES)
+
+
+def _iter_word(word: int, base: int):
+    """Yields base + i for every set bit i of a single machine-word-sized int."""
+    while word:
+        lowest = word & -word
+        yield base + lowest.bit_length() - 1
+        word ^= lowest
+
+
+def _iter_positions(bitset: int):
+    """Yields the positions of all set bits, lowest first."""
+    if bitset < 1 << 64:
+        yield from _iter_word(bitset, 0)
+        return
+    # Clearing bits one by one would reallocate the whole big int for every bit,
+    # so large sets are split into 64-bit words once and scanned word by word.
+    data = bitset.to_bytes((bitset.bit_length() + 63) // 64 * _WORD_BYTES, 'little')
+    for offset in range(0, len(data), _WORD_BYTES):
+        chunk = data[offset:offset + _WORD_BYTES]
+        if chunk != _ZERO_WORD:
+            yield from _iter_word(int.from_bytes(chunk, 'little'), offset * 8)
+
+
+class PositionInfo:
+    """The nullable/first/last attributes of one AST subtree."""
+    __slots__ = ("nullable", "first", "last")
+
+    def __init__(self, nullable: bool, first: int, last: int):
+        self.nullable = nullable
+        self.first = first
+        self.last = last
+
+
+# --- The Glushkov Builder (AST Visitor) ---
+
+class GlushkovBuilder:
+    """
+    Walks a completed Abstract Syntax Tree and builds the Glushkov (position)
+    automaton. Every operand is a numbered position; the NFA has one state per
+    position plus a start state, and no epsilon transitions.
+    """
+    def __init__(self):
+        # symbols[i] is the character at position i. Position 0 is reserved for the start state.
+        self.symbols = [None]
+        # Shared (last, first) bitset pairs; see the note on Position Sets above.
+        self.follow_pairs = []
+
+    def build(self, ast_node: ASTNode) -> NFA:
+        """The main public entry point: computes the position sets and emits the NFA."""
+        info = self._visit(ast_node)
+
+        states = [f"q{i}" for i in range(len(self.symbols))]
+        transitions = [[states[0], self.symbols[j], states[j]] for j in _iter_positions(info.first)]
+        for i, follow in enumerate(self._resolve_follow()):
+            if not follow:
+                continue
+            for j in _iter_positions(follow):
+                transitions.append([states[i], self.symbols[j], states[j]])
+
+        final_states = [states[i] for i in _iter_positions(info.last)]
+        if info.nullable:
+            final_states.insert(0, states[0])
+
+        return NFA(states=states, alphabet=self.symbols[1:], transitions=transitions,
+                   start_state=states[0], final_states=final_states)
+
+    def _resolve_follow(self) -> list[int]:
+        """
+        Turns the shared (last, first) pairs into one follow bitset per position.
+        A position reached by a single pair reuses that pair's `first` bitset as is;
+        only positions reached by several distinct bitsets pay for a union.
+        """
+        shared = [[] for _ in self.symbols]
+        for last, first in self.follow_pairs:
+            for position in _iter_positions(last):
+                shared[position].append(first)
+
+        follow = []
+        for firsts in shared:
+            if len(firsts) <= 1:
+                follow.append(firsts[0] if firsts else 0)
+                continue
+            distinct = {id(first): first for first in firsts}.values()
+            union = 0
+            for first in distinct:
+                union |= first
+            follow.append(union)
+        return follow
+
+    def _visit(self, node: ASTNode) -> PositionInfo:
+        # This is a dispatch table that maps node types to their visit methods.
+        visit_method = getattr(self, f'_visit_{type(node).__name__}', self._generic_visit)
+        return visit_method(node)
+
+    def _generic_visit(self, node):
+        # This will be called if we ever create an AST node we forgot to handle.
+        raise Exception(f'No _visit method for AST node of type {type(node).__name__}')
+
+    def _visit_OperandNode(self, node: OperandNode) -> PositionInfo:
+        # Base case of the recursion: a fresh position.
+        position = len(self.symbols)
+        self.symbols.append(node.value)
+        bit = 1 << position
+        return PositionInfo(nullable=False, first=bit, last=bit)
+
+    def _visit_ConcatNode(self, node: ConcatNode) -> PositionInfo:
+        left = self._visit(node.left)
+        right = self._visit(node.right)
+        # Anything that can end the left side can be followed by anything that starts the right side.
+        self.follow_pairs.append((left.last, right.first))
+        return PositionInfo(
+            nullable=left.nullable and right.nullable,
+            first=left.first | right.first if left.nullable else left.first,
+            last=left.last | right.last if right.nullable else right.last,
+        )
+
+    def _visit_UnionNode(self, node: UnionNode) -> PositionInfo:
+        left = self._visit(node.left)
+        right = self._visit(node.right)
+        return PositionInfo(
+            nullable=left.nullable or right.nullable,
+            first=left.first | right.first,
+            last=left.last | right.last,
+        )
+
+    def _visit_StarNode(self, node: StarNode) -> PositionInfo:
+        operand = self._visit(node.operand)
+        # Looping back: the end of one iteration can be followed by the start of the next.
+        self.follow_pairs.append((operand.last, operand.first))
+        return PositionInfo(nullable=True, first=operand.first, last=operand.last)
@@ -72,4 +72,27 @@ def test_api_malformed_request_returns_400(client):
     assert response.status_code == 400
     data = response.get_json()
     assert "error" in data
-    assert "'regex' key is missing" in data["error"]
\ No newline at end of file
+    assert "'regex' key is missing" in data["error"]
+
+def test_api_glushkov_engine_returns_epsilon_free_nfa(client):
+    """
+    Selects the Glushkov engine per request and checks the response has no epsilon transitions.
+    """
+    payload = {"regex": "a(b|c)*", "engine": "glushkov"}
+
+    response = client.post("/api/regex-to-nfa", json=payload)
+
+    assert response.status_code == 200
+    data = response.get_json()
+    assert len(data["states"]) == 4
+    assert all(t[1] != "" for t in data["transitions"])
+    assert data["alphabet"] == ["a", "b", "c"]
+
+
+def test_api_unknown_engine_returns_400(client):
+    payload = {"regex": "a", "engine": "nope"}
+
+    response = client.post("/api/regex-to-nfa", json=payload)
+
+    assert response.status_code == 400
+    assert "Unknown engine" in response.get_json()["error"]
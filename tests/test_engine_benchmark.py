@@ -0,0 +1,16 @@
+# tests/test_engine_benchmark.py
+
+import json
+from benchmarks.engine_benchmark import main
+
+
+def test_failing_category_is_recorded_instead_of_aborting(tmp_path):
+    """The 512-wide union exceeds the recursion limit; the report must still be written."""
+    output = tmp_path / "report.json"
+    main(["--corpus-size", "5", "--deep", "4", "--wide", "8,512", "--repeat", "1", "--output", str(output)])
+
+    categories = json.loads(output.read_text())["categories"]
+    assert set(categories) == {"realistic", "deep_4", "wide_8", "wide_512"}
+    assert categories["wide_8"]["glushkov"]["epsilon_transitions"] == 0
+    for engine in ("thompson", "glushkov"):
+        assert categories["wide_512"][engine]["error"] == "RecursionError"
@@ -0,0 +1,175 @@
+# tests/test_glushkov.py
+
+import pytest
+from hypothesis import given, strategies as st, settings
+from logic import regex_to_nfa
+from logic.ast_nodes import *
+from logic.glushkov_builder import GlushkovBuilder, _iter_positions
+from logic.parser import RegexParser
+from logic.tokenizer import tokenize
+from logic.nfa_builder import NFABuilder, NFA
+
+
+def accepts(nfa: NFA, word: str) -> bool:
+    """Simulates an NFA (with or without epsilon transitions) on a word."""
+    epsilon_moves, symbol_moves = {}, {}
+    for source, symbol, target in nfa.transitions:
+        if symbol == '':
+            epsilon_moves.setdefault(source, set()).add(target)
+        else:
+            symbol_moves.setdefault((source, symbol), set()).add(target)
+
+    def closure(states):
+        stack, seen = list(states), set(states)
+        while stack:
+            for target in epsilon_moves.get(stack.pop(), ()):
+                if target not in seen:
+                    seen.add(target)
+                    stack.append(target)
+        return seen
+
+    current = closure({nfa.start_state})
+    for char in word:
+        current = closure({t for s in current for t in symbol_moves.get((s, char), ())})
+    return bool(current & set(nfa.final_states))
+
+
+class TestGlushkovBuilder:
+
+    def test_builds_from_operand_node(self):
+        nfa = GlushkovBuilder().build(OperandNode('a'))
+
+        assert isinstance(nfa, NFA)
+        assert nfa.states == ['q0', 'q1']
+        assert nfa.transitions == [['q0', 'a', 'q1']]
+        assert nfa.final_states == ['q1']
+
+    def test_builds_from_concat_node(self):
+        nfa = GlushkovBuilder().build(ConcatNode(OperandNode('a'), OperandNode('b')))
+
+        assert len(nfa.states) == 3
+        assert nfa.transitions == [['q0', 'a', 'q1'], ['q1', 'b', 'q2']]
+        assert nfa.final_states == ['q2']
+
+    def test_builds_from_union_node(self):
+        nfa = GlushkovBuilder().build(UnionNode(OperandNode('a'), OperandNode('b')))
+
+        assert len(nfa.states) == 3
+        assert nfa.transitions == [['q0', 'a', 'q1'], ['q0', 'b', 'q2']]
+        assert nfa.final_states == ['q1', 'q2']
+
+    def test_builds_from_star_node(self):
+        nfa = GlushkovBuilder().build(StarNode(OperandNode('a')))
+
+        assert len(nfa.states) == 2
+        assert nfa.transitions == [['q0', 'a', 'q1'], ['q1', 'a', 'q1']]
+        # The empty word is accepted, so the start state is final.
+        assert nfa.final_states == ['q0', 'q1']
+
+    def test_builds_from_deeply_nested_ast(self):
+        """a(b|c)* has three positions, so four states and no epsilon transitions."""
+        ast = ConcatNode(
+            OperandNode('a'),
+            StarNode(UnionNode(OperandNode('b'), OperandNode('c')))
+        )
+        nfa = GlushkovBuilder().build(ast)
+
+        assert len(nfa.states) == 4
+        assert nfa.alphabet == ['a', 'b', 'c']
+        assert not [t for t in nfa.transitions if t[1] == '']
+        # q0 -a-> q1, then each of q1, q2, q3 can move to q2 (b) or q3 (c).
+        assert len(nfa.transitions) == 7
+        assert nfa.final_states == ['q1', 'q2', 'q3']
+
+    def test_engine_is_selectable(self):
+        assert len(regex_to_nfa("a(b|c)*", engine="glushkov").states) == 4
+        assert len(regex_to_nfa("a(b|c)*", engine="thompson").states) == 10
+
+    def test_unknown_engine_raises_value_error(self):
+        with pytest.raises(ValueError, match="Unknown engine 'dfa'"):
+            regex_to_nfa("a", engine="dfa")
+
+
+# --- Position Sets wider than one 64-bit word ---
+
+def naive_positions(bitset: int) -> list[int]:
+    return [i for i in range(bitset.bit_length()) if bitset >> i & 1]
+
+
+@pytest.mark.parametrize("bitset", [
+    0,
+    (1 << 64) - 1,
+    1 << 64,
+    (1 << 64) | 1,
+    (1 << 200) - 1,
+    (1 << 1000) | (1 << 500) | (1 << 63) | (1 << 64),
+    sum(1 << i for i in range(0, 700, 7)),
+])
+def test_iter_positions_matches_naive_scan(bitset):
+    assert list(_iter_positions(bitset)) == naive_positions(bitset)
+
+
+@given(st.integers(min_value=0, max_value=(1 << 300) - 1))
+@settings(max_examples=300, deadline=500)
+def test_iter_positions_matches_naive_scan_on_random_bitsets(bitset):
+    assert list(_iter_positions(bitset)) == naive_positions(bitset)
+
+
+@pytest.mark.parametrize("regex", [
+    "|".join("abc"[i % 3] for i in range(100)),
+    "(" + "ab" * 40 + ")*c",
+    "(" + "|".join(["(a|b)c*"] * 40) + ")*",
+])
+def test_glushkov_matches_thompson_beyond_64_positions(regex):
+    """These regexes have more than 64 positions, so the word-by-word bitset scan is used."""
+    ast = RegexParser(tokenize(regex)).parse()
+    thompson = NFABuilder().build(ast)
+    glushkov = GlushkovBuilder().build(ast)
+
+    assert len(glushkov.states) - 1 == sum(char.isalnum() for char in regex) > 64
+    words = ["", "a", "c", "ab" * 40 + "c", "ab" * 80 + "c", "ab" * 40, "acb", "bccca", "aab"]
+    for word in words:
+        assert accepts(glushkov, word) == accepts(thompson, word)
+
+
+# --- Property Tests: cross-check against the Thompson engine ---
+
+ALPHABET = "abc"
+
+regex_asts = st.recursive(
+    st.sampled_from(ALPHABET).map(OperandNode),
+    lambda children: st.one_of(
+        st.tuples(children, children).map(lambda c: ConcatNode(*c)),
+        st.tuples(children, children).map(lambda c: UnionNode(*c)),
+        children.map(StarNode),
+    ),
+    max_leaves=12,
+)
+
+
+def count_operands(node: ASTNode) -> int:
+    if isinstance(node, OperandNode):
+        return 1
+    if isinstance(node, StarNode):
+        return count_operands(node.operand)
+    return count_operands(node.left) + count_operands(node.right)
+
+
+@given(regex_asts, st.lists(st.text(alphabet=ALPHABET, max_size=6), min_size=1, max_size=10))
+@settings(max_examples=300, deadline=500)
+def test_glushkov_accepts_same_language_as_thompson(ast, words):
+    thompson = NFABuilder().build(ast)
+    glushkov = GlushkovBuilder().build(ast)
+
+    for word in words:
+        assert accepts(glushkov, word) == accepts(thompson, word)
+
+
+@given(regex_asts)
+@settings(max_examples=300, deadline=500)
+def test_glushkov_has_n_plus_one_states_and_no_epsilon(ast):
+    nfa = GlushkovBuilder().build(ast)
+
+    assert len(nfa.states) == count_operands(ast) + 1
+    assert all(symbol != '' for _, symbol, _ in nfa.transitions)
+    assert nfa.alphabet == NFABuilder().build(ast).alphabet
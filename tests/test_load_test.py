@@ -0,0 +1,91 @@
+# tests/test_load_test.py
+
+import http.client
+import json
+import pytest
+import urllib.request
+from benchmarks import load_test
+from benchmarks.load_test import build_corpus, deep_regex, wide_regex, percentile, main, run_level
+from logic import regex_to_nfa
+
+
+class TestLoadTestHarness:
+
+    def test_corpus_is_deterministic_for_a_seed(self):
+        assert build_corpus(100, seed=7) == build_corpus(100, seed=7)
+        assert build_corpus(100, seed=7) != build_corpus(100, seed=8)
+
+    def test_generated_corpus_is_valid_regex(self):
+        """Every generated entry must be accepted by the engine, so errors in a run mean server trouble."""
+        for _, regex in build_corpus(200, seed=1, wide_widths=(64,)):
+            regex_to_nfa(regex)
+
+    def test_corpus_entries_are_tagged_with_their_category(self):
+        corpus = build_corpus(200, seed=1, deep_depths=(16,), wide_widths=(64,), adversarial_ratio=0.5)
+        assert {category for category, _ in corpus} == {"realistic", "deep_16", "wide_64"}
+        assert all(regex == wide_regex(64) for category, regex in corpus if category == "wide_64")
+
+    def test_adversarial_shapes(self):
+        assert deep_regex(2) == "((a)*b)*b"
+        assert wide_regex(3) == "a|b|c"
+
+    def test_percentile_uses_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 50) is None
+
+    def test_truncated_responses_are_counted_as_connection_errors(self, monkeypatch):
+        """A worker dying mid-response raises an HTTPException, which must show up in the report."""
+        def broken_urlopen(*args, **kwargs):
+            raise http.client.IncompleteRead(b"")
+        monkeypatch.setattr(urllib.request, "urlopen", broken_urlopen)
+
+        level = run_level("http://127.0.0.1:1", [("realistic", "a")], concurrency=2, total_requests=10)
+
+        assert level["requests"] == 10
+        assert level["error_rate"] == 1.0
+        assert level["status_counts"] == {"connection_error": 10}
+
+    def test_unexpected_client_errors_are_raised(self, monkeypatch):
+        def crash(*args, **kwargs):
+            raise RuntimeError("client bug")
+        monkeypatch.setattr(load_test, "send_request", crash)
+
+        with pytest.raises(RuntimeError, match="client bug"):
+            run_level("http://127.0.0.1:1", [("realistic", "a")], concurrency=2, total_requests=10)
+
+    @pytest.mark.parametrize("bad_args", [
+        ["--requests", "0"],
+        ["--concurrency", "0"],
+        ["--concurrency", "1,-4"],
+        ["--concurrency", ","],
+        ["--wide", "abc"],
+        ["--wide", "0"],
+        ["--deep", "-1"],
+        ["--timeout", "0"],
+        ["--timeout", "nan"],
+        ["--adversarial-ratio", "1.5"],
+        ["--adversarial-ratio", "-0.1"],
+        ["--engine", "glushkv"],
+    ])
+    def test_rejects_invalid_arguments(self, bad_args, tmp_path):
+        with pytest.raises(SystemExit):
+            main(bad_args + ["--output", str(tmp_path / "report.json")])
+        assert not (tmp_path / "report.json").exists()
+
+    def test_inprocess_run_writes_json_report(self, tmp_path):
+        output = tmp_path / "report.json"
+        main(["--target", "inprocess", "--concurrency", "1,2", "--requests", "20", "--warmup", "0",
+              "--corpus-size", "20", "--wide", "8", "--output", str(output)])
+
+        report = json.loads(output.read_text())
+        assert report["target"] == "inprocess"
+        assert report["rss_includes_client"] is True
+        assert [level["concurrency"] for level in report["levels"]] == [1, 2]
+        for level in report["levels"]:
+            assert level["requests"] == 20
+            assert level["error_rate"] == 0
+            assert level["latency_ms"]["p50"] <= level["latency_ms"]["p99"]
+            assert level["worker_rss_kb"]
+            assert sum(c["requests"] for c in level["categories"].values()) == 20